@@ -1,20 +1,278 @@
 import os
-import shutil
-from huggingface_hub import HfApi, hf_hub_download
+import re
+import json
+import queue
+import tempfile
+import random
+import fnmatch
+import hashlib
+import functools
+import logging
+import time
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+# Multi-part chunked transfers for large files (optional `hf_transfer` extra).
+# Must be set before huggingface_hub is imported, it reads the flag at import time.
+if importlib.util.find_spec("hf_transfer") is not None:
+	os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from urllib.parse import quote
+from huggingface_hub import HfApi, CommitOperationAdd, CommitOperationDelete, hf_hub_download, snapshot_download, get_session, constants
+from huggingface_hub.utils import HfHubHTTPError, LocalEntryNotFoundError, build_hf_headers, hf_raise_for_status
+
+# Dropped connections / timeouts worth retrying, for whichever HTTP backend is in use
+CONNECTION_ERRORS = ()
+
+try:
+	# requests backend (huggingface_hub<1.0)
+	import requests
+	from urllib3.util.retry import Retry
+	from huggingface_hub import configure_http_backend
+	from huggingface_hub.utils._http import UniqueRequestIdAdapter as _BaseAdapter
+	CONNECTION_ERRORS += (requests.ConnectionError, requests.Timeout)
+except ImportError:
+	configure_http_backend = None
+
+try:
+	# httpx backend (huggingface_hub>=1.0), which ships its own pooled client
+	import httpx
+	CONNECTION_ERRORS += (httpx.TransportError,)
+except ImportError:
+	pass
+
+__all__ = ["HFDatasetClient", "DEFAULT_IGNORE_PATTERNS", "set_log_level"]
+
+
+def _backend_factory():
+	# Pooled keep-alive session shared by every HfApi / hf_hub_download call.
+	# Only connection failures are retried here; status retries are left to _with_retry.
+	session = requests.Session()
+	adapter = _BaseAdapter(
+		pool_connections=32,
+		pool_maxsize=32,
+		max_retries=Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5)
+	)
+	session.mount("http://", adapter)
+	session.mount("https://", adapter)
+	return session
+
+
+if configure_http_backend is not None and not constants.HF_HUB_OFFLINE:
+	configure_http_backend(backend_factory=_backend_factory)
+
+
+logger = logging.getLogger("hf_dataset_client")
+
+
+def set_log_level(level):
+	"""
+	Set the client's log level (e.g., logging.DEBUG to see per-file progress).
+	If logging isn't configured yet (no handler here or on the root logger),
+	a stderr handler is attached so the messages are actually shown.
+	"""
+	logger.setLevel(level)
+	if not logger.handlers and not logging.getLogger().handlers:
+		handler = logging.StreamHandler()
+		handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+		logger.addHandler(handler)
+
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 5
+COMMIT_BATCH_SIZE = 100
+# The Hub stores files above this in LFS (compared by sha256); smaller ones are
+# usually regular git blobs (compared by blob id)
+LFS_THRESHOLD = 10 * 1024 * 1024
+
+
+def _is_transient(error: Exception) -> bool:
+	if isinstance(error, LocalEntryNotFoundError):
+		# hf_hub_download wraps a dropped connection on its metadata request in this
+		return isinstance(error.__cause__, CONNECTION_ERRORS)
+	if isinstance(error, HfHubHTTPError):
+		return error.response is not None and error.response.status_code in RETRY_STATUS_CODES
+	return isinstance(error, CONNECTION_ERRORS)
+
+
+def _with_retry(fn, *args, **kwargs):
+	"""
+	Call fn, retrying transient Hub errors (429/5xx, dropped connections)
+	with exponential backoff and jitter. Other errors are raised immediately.
+	"""
+	for attempt in range(MAX_ATTEMPTS):
+		try:
+			return fn(*args, **kwargs)
+		except Exception as e:
+			if not _is_transient(e) or attempt == MAX_ATTEMPTS - 1:
+				raise
+			error = e
+
+		delay = 0.5 * 2 ** attempt + random.random()
+		logger.warning("Attempt %d/%d failed (%s), retrying in %.1fs", attempt + 1, MAX_ATTEMPTS, error, delay)
+		time.sleep(delay)
+
+
+DEFAULT_IGNORE_PATTERNS = [".git/*", ".DS_Store", ".*"]
+
+# upload_folder_files only: fnmatch's "*" also matches "/", so these apply the
+# root rules at every depth (like its original per-name dotfile skip)
+NESTED_IGNORE_PATTERNS = ["*/.git/*", "*/.DS_Store", "*/.*"]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_ignore(patterns: tuple):
+	"""
+	Fold fnmatch-style patterns into one compiled regex (matched against repo-relative paths).
+	"""
+	return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+def _scan_files(folder: str, ignore_re, rel_dir: str = ""):
+	"""
+	Recursively yield (DirEntry, rel_path) for files under folder, skipping ignored paths.
+	Uses the readdir file type, so no extra stat per entry; symlinked dirs are not followed.
+	Unreadable folders are logged and skipped, like os.walk does.
+	"""
+	try:
+		it = os.scandir(folder)
+	except OSError as e:
+		logger.warning("Skipping unreadable folder %s: %s", folder, e)
+		return
+
+	with it:
+		for entry in it:
+			rel_path = f"{rel_dir}{entry.name}"
+			if entry.is_dir(follow_symlinks=False):
+				# Prune before recursing so ignored subtrees are never listed
+				if not ignore_re.match(f"{rel_path}/"):
+					yield from _scan_files(entry.path, ignore_re, f"{rel_path}/")
+			elif entry.is_file() and not ignore_re.match(rel_path):
+				yield entry, rel_path
+
+
+def _file_digest(local_path: str, h, header: bytes = b"") -> str:
+	h.update(header)
+	with open(local_path, "rb") as f:
+		for chunk in iter(lambda: f.read(1 << 20), b""):
+			h.update(chunk)
+	return h.hexdigest()
+
+
+def _git_blob_sha1(local_path: str, size: int) -> str:
+	# Hub blob_id for regular (non-LFS) files is the git object id
+	return _file_digest(local_path, hashlib.sha1(), f"blob {size}\0".encode())
+
+
+HASH_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "hf_dataset_client", "hashes.json")
+
+
+class _HashCache:
+	"""
+	Persistent {abs_path: {mtime_ns, size, uploaded_to, sha256}} map.
+	An entry is only trusted while the file's (mtime, size) are unchanged.
+	"""
+	def __init__(self, path: str = HASH_CACHE_PATH):
+		self.path = path
+		self._lock = threading.Lock()
+		self._dirty = set()
+		self._data = self._load()
+
+	def _load(self) -> dict:
+		try:
+			with open(self.path, "r") as f:
+				return json.load(f)
+		except (OSError, ValueError):
+			return {}
+
+	def _entry(self, local_path: str) -> dict:
+		key = os.path.abspath(local_path)
+		st = os.stat(key)
+		with self._lock:
+			entry = self._data.get(key)
+			if not entry or entry["mtime_ns"] != st.st_mtime_ns or entry["size"] != st.st_size:
+				entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "uploaded_to": []}
+				self._data[key] = entry
+				self._dirty.add(key)
+			return entry
+
+	def is_uploaded(self, local_path: str, target: str) -> bool:
+		try:
+			return target in self._entry(local_path)["uploaded_to"]
+		except OSError:
+			return False
+
+	def _digest(self, local_path: str, key: str, compute) -> str:
+		entry = self._entry(local_path)
+		if key not in entry:
+			digest = compute(local_path, entry["size"])
+			with self._lock:
+				entry[key] = digest
+				self._dirty.add(os.path.abspath(local_path))
+		return entry[key]
 
+	def sha256(self, local_path: str) -> str:
+		return self._digest(local_path, "sha256", lambda path, size: _file_digest(path, hashlib.sha256()))
 
-class PrintLogger:
-	@staticmethod
-	def info(msg):
-		print(f"[INFO] {msg}")
+	def blob_id(self, local_path: str) -> str:
+		return self._digest(local_path, "blob_id", _git_blob_sha1)
 
-	@staticmethod
-	def success(msg):
-		print(f"[SUCCESS] {msg}")
+	def cached_sha256(self, local_path: str):
+		return self._entry(local_path).get("sha256")
 
-	@staticmethod
-	def error(msg):
-		print(f"[ERROR] {msg}")
+	def store_digests(self, local_path: str, **digests):
+		try:
+			entry = self._entry(local_path)
+		except OSError:
+			return
+		with self._lock:
+			entry.update((key, value) for key, value in digests.items() if value)
+			self._dirty.add(os.path.abspath(local_path))
+
+	def mark_uploaded(self, local_path: str, target: str):
+		try:
+			entry = self._entry(local_path)
+		except OSError:
+			# File moved or deleted since it was uploaded; nothing to record
+			return
+		with self._lock:
+			if target not in entry["uploaded_to"]:
+				entry["uploaded_to"].append(target)
+			self._dirty.add(os.path.abspath(local_path))
+
+	def forget(self, targets):
+		targets = set(targets)
+		with self._lock:
+			for key, entry in self._data.items():
+				if any(t in targets for t in entry["uploaded_to"]):
+					entry["uploaded_to"] = [t for t in entry["uploaded_to"] if t not in targets]
+					self._dirty.add(key)
+
+	def save(self):
+		"""
+		Best-effort write: merges this instance's changes over the file on disk
+		(so other clients' entries survive) and drops entries no longer uploaded anywhere.
+		"""
+		with self._lock:
+			if not self._dirty:
+				return
+			try:
+				data = self._load()
+				for key in self._dirty:
+					data[key] = self._data[key]
+				data = {k: v for k, v in data.items() if v["uploaded_to"]}
+
+				folder = os.path.dirname(self.path)
+				os.makedirs(folder, exist_ok=True)
+				with tempfile.NamedTemporaryFile("w", dir=folder, suffix=".tmp", delete=False) as f:
+					json.dump(data, f)
+				os.replace(f.name, self.path)
+			except OSError as e:
+				logger.warning("Could not save hash cache %s: %s", self.path, e)
+				return
+			self._data.update(data)
+			self._dirty.clear()
 
 
 class HFDatasetClient:
@@ -33,30 +291,61 @@ class HFDatasetClient:
 		self.repo_type = "dataset"
 		self.branch = "main"
 
+		# per-call kwargs shared by every Hub request, built once
+		self._base_kwargs = {"repo_id": self.repo_id, "repo_type": self.repo_type, "revision": self.branch}
+		self._upload_msg = "Upload media"
+		self._target_prefix = f"{self.repo_id}@{self.branch}:"
+		self._upload_workers = int(os.getenv("HF_UPLOAD_WORKERS", "8"))
+		self._download_workers = int(os.getenv("HF_DOWNLOAD_WORKERS", "8"))
+
+		if self._upload_workers < 1 or self._download_workers < 1:
+			raise ValueError("HF_UPLOAD_WORKERS and HF_DOWNLOAD_WORKERS must be at least 1.")
+
 		# init api
 		self.api = HfApi(token=self.token)
+		self._hash_cache = _HashCache()
 
-		PrintLogger.info(f"HFMediaClient initialized using repo: {self.repo_id}")
+		# list_files cache, revalidated with the last ETag once the TTL expires
+		self._files_cache = None
+		self._files_cache_ts = 0.0
+		self._files_cache_ttl = float(os.getenv("HF_LIST_TTL", "60"))
+		self._files_etag = None
+		self._info_url = f"{self.api.endpoint}/api/datasets/{self.repo_id}/revision/{quote(self.branch, safe='')}"
+
+		logger.info("HFMediaClient initialized using repo: %s", self.repo_id)
 
 	# --------------------------
 	#		UPLOAD
 	# --------------------------
+	def _target(self, repo_path: str) -> str:
+		return self._target_prefix + repo_path
+
 	def upload(self, local_path: str, repo_path: str):
-		PrintLogger.info(f"Uploading {local_path} → {repo_path}")
+		ok = self._upload_file(local_path, repo_path)
+		self._hash_cache.save()
+		if ok:
+			logger.info("Uploaded: %s → %s", local_path, repo_path)
+		return ok
+
+	def _upload_file(self, local_path: str, repo_path: str):
+		logger.debug("Uploading %s → %s", local_path, repo_path)
 
 		try:
-			self.api.upload_file(
-				path_or_fileobj=local_path,
-				path_in_repo=repo_path,
-				repo_id=self.repo_id,
-				repo_type=self.repo_type,
-				revision=self.branch,
-				commit_message=f"Upload media"
+			# Same single-file commit upload_file makes, but keeps the op's sha256 for the cache
+			op = CommitOperationAdd(path_in_repo=repo_path, path_or_fileobj=local_path)
+			_with_retry(
+				self.api.create_commit,
+				operations=[op],
+				**self._base_kwargs,
+				commit_message=self._upload_msg
 			)
-			PrintLogger.success(f"Uploaded: {repo_path}")
+			self._store_op_digests(local_path, op)
+			self._hash_cache.mark_uploaded(local_path, self._target(repo_path))
+			self._invalidate_files_cache()
+			logger.debug("Uploaded: %s", repo_path)
 			return True
 		except Exception as e:
-			PrintLogger.error(f"Upload failed: {e}")
+			logger.error("Upload failed: %s", e)
 		return False
 
 	# --------------------------
@@ -70,108 +359,470 @@ class HFDatasetClient:
 		ignore_patterns: List of patterns to ignore (e.g., ["*.txt", "temp/*"])
 		"""
 		if not os.path.isdir(local_folder):
-			PrintLogger.error(f"Folder not found: {local_folder}")
+			logger.error("Folder not found: %s", local_folder)
 			return False
 
-		PrintLogger.info(f"Uploading folder: {local_folder}")
+		logger.info("Uploading folder: %s", local_folder)
 
 		try:
-			# Default patterns
-			default_ignore = [".git/*", ".DS_Store", ".*"]
-
-			# Merge with user-provided patterns
-			if ignore_patterns:
-				all_ignore_patterns = default_ignore + ignore_patterns
-			else:
-				all_ignore_patterns = default_ignore
+			# Merge default patterns with user-provided patterns
+			all_ignore_patterns = DEFAULT_IGNORE_PATTERNS + (ignore_patterns or [])
 
 			# Use HfApi's upload_folder method for better performance
 			self.api.upload_folder(
 				folder_path=local_folder,
 				path_in_repo=repo_base_path,
-				repo_id=self.repo_id,
-				repo_type=self.repo_type,
-				revision=self.branch,
+				**self._base_kwargs,
 				commit_message=f"Upload folder: {local_folder}",
 				ignore_patterns=all_ignore_patterns
 			)
 
-			PrintLogger.success("Folder upload completed!")
+			self._invalidate_files_cache()
+			logger.info("Folder upload completed!")
 			return True
 		except Exception as e:
-			PrintLogger.error(f"Upload folder failed: {e}")
+			logger.error("Upload folder failed: %s", e)
 			return False
 
 	# --------------------------
-	#		LIST
+	#	   UPLOAD MANY
 	# --------------------------
-	def list_files(self):
+	def upload_many(self, files):
 		"""
-		List all files in the Hugging Face dataset repo.
+		Upload several files concurrently, one commit per file.
+		Files unchanged since their last upload to the same repo path are skipped
+		once the repo copy is confirmed to still match.
+		files: Iterable of (local_path, repo_path) pairs.
+		Returns (succeeded, failed) lists of repo paths.
+		"""
+		jobs = []
+		candidates = []
+		for local_path, repo_path in files:
+			if self._hash_cache.is_uploaded(local_path, self._target(repo_path)):
+				candidates.append((local_path, repo_path))
+			else:
+				jobs.append((local_path, repo_path))
+
+		# The local cache only knows what this client uploaded; the repo may
+		# have changed since (web UI, another machine), so confirm before skipping
+		skipped = []
+		if candidates:
+			remote = self._remote_files_metadata()
+			with ThreadPoolExecutor(max_workers=self._upload_workers) as ex:
+				same = list(ex.map(lambda job: self._matches_remote(*job, remote), candidates))
+			for (local_path, repo_path), ok in zip(candidates, same):
+				if ok:
+					skipped.append(repo_path)
+				else:
+					jobs.append((local_path, repo_path))
+		if skipped:
+			logger.info("Skipping %d unchanged files", len(skipped))
+
+		try:
+			with ThreadPoolExecutor(max_workers=self._upload_workers) as ex:
+				results = list(ex.map(lambda job: self._upload_file(*job), jobs))
+		finally:
+			self._hash_cache.save()
+
+		succeeded = skipped + [repo_path for (_, repo_path), ok in zip(jobs, results) if ok]
+		failed = [repo_path for (_, repo_path), ok in zip(jobs, results) if not ok]
+
+		if failed:
+			logger.error("%d/%d uploads failed: %s", len(failed), len(jobs), failed)
+		else:
+			logger.info("Uploaded %d files", len(jobs))
+		return succeeded, failed
+
+	# --------------------------
+	#	 UPLOAD FOLDER FILES
+	# --------------------------
+	def upload_folder_files(self, local_folder: str, repo_base_path: str = "", ignore_patterns=None, skip_unchanged: bool = True):
+		"""
+		Upload a folder (recursive) as a pipeline: a producer thread walks the folder into
+		a bounded queue, worker threads hash the files, and this thread pre-uploads and
+		commits them in batches while the walk and hashing carry on.
+		Use this for large or incremental syncs; otherwise prefer upload_folder.
+		ignore_patterns: Same as upload_folder, merged with the defaults; unlike
+			upload_folder, dot-prefixed files and folders are skipped at every depth.
+		skip_unchanged: Skip files whose size and hash already match the repo copy.
+		Returns (succeeded, failed) lists of repo paths. If the walk itself fails, the
+		files found so far are still committed and the error is re-raised afterwards.
+		"""
+		if not os.path.isdir(local_folder):
+			logger.error("Folder not found: %s", local_folder)
+			return [], []
+
+		ignore_re = _compile_ignore(tuple(DEFAULT_IGNORE_PATTERNS + NESTED_IGNORE_PATTERNS + (ignore_patterns or [])))
+		remote = self._remote_files_metadata() if skip_unchanged else {}
+
+		logger.info("Uploading folder: %s", local_folder)
+
+		workers = self._upload_workers
+		jobs = queue.Queue(maxsize=COMMIT_BATCH_SIZE)
+		results = queue.Queue(maxsize=COMMIT_BATCH_SIZE)
+
+		stop = threading.Event()
+		walk_error = None
+
+		def put(q, item):
+			# Give up once the consumer has stopped, instead of blocking on a full queue
+			while not stop.is_set():
+				try:
+					q.put(item, timeout=0.1)
+					return True
+				except queue.Full:
+					pass
+			return False
+
+		def produce():
+			nonlocal walk_error
+			try:
+				for entry, rel_path in _scan_files(local_folder, ignore_re):
+					repo_path = f"{repo_base_path}/{rel_path}" if repo_base_path else rel_path
+					if not put(jobs, (entry.path, repo_path)):
+						return
+			except Exception as e:
+				walk_error = e
+			finally:
+				for _ in range(workers):
+					put(jobs, None)
+
+		def prepare():
+			try:
+				while not stop.is_set():
+					try:
+						job = jobs.get(timeout=0.1)
+					except queue.Empty:
+						continue
+					if job is None:
+						break
+
+					local_path, repo_path = job
+					try:
+						item = (local_path, repo_path, self._prepare_addition(local_path, repo_path, remote), None)
+					except Exception as e:
+						item = (local_path, repo_path, None, e)
+					if not put(results, item):
+						break
+			finally:
+				put(results, None)
+
+		threads = [threading.Thread(target=produce, daemon=True)]
+		threads += [threading.Thread(target=prepare, daemon=True) for _ in range(workers)]
+		for t in threads:
+			t.start()
+
+		succeeded, failed, unchanged = [], [], []
+		try:
+			# Commit each batch as soon as it is hashed; later files keep hashing meanwhile
+			batch = []
+			finished = 0
+			while finished < workers:
+				item = results.get()
+				if item is None:
+					finished += 1
+					continue
+
+				local_path, repo_path, op, error = item
+				if error is not None:
+					logger.error("Failed to read %s: %s", local_path, error)
+					failed.append(repo_path)
+					continue
+
+				if op is None:
+					unchanged.append(repo_path)
+					continue
+
+				batch.append((local_path, op))
+				if len(batch) >= COMMIT_BATCH_SIZE:
+					self._commit_additions(batch, succeeded, failed)
+					batch = []
+
+			if batch:
+				self._commit_additions(batch, succeeded, failed)
+		finally:
+			# Release the producer and workers if we bailed out early
+			stop.set()
+			for t in threads:
+				t.join()
+			self._hash_cache.save()
+
+		if walk_error is not None:
+			logger.error("Failed to scan %s: %s", local_folder, walk_error)
+			raise walk_error
+
+		if unchanged:
+			logger.info("Skipped %d files already up to date in the repo", len(unchanged))
+		if failed:
+			logger.error("%d/%d uploads failed: %s", len(failed), len(failed) + len(succeeded), failed)
+		else:
+			logger.info("Uploaded %d files", len(succeeded))
+		return unchanged + succeeded, failed
+
+	def _prepare_addition(self, local_path: str, repo_path: str, remote: dict):
+		"""
+		Return a hashed CommitOperationAdd for the file, or None if the repo already has it.
 		"""
-		PrintLogger.info("Fetching file list...")
+		size, sha256, _ = remote.get(repo_path, (None, None, None))
+		if sha256 and os.path.getsize(local_path) == size and self._hash_cache.cached_sha256(local_path) is None:
+			# Same-size LFS file with no cached hash: hash it once through the op and compare that
+			op = CommitOperationAdd(path_in_repo=repo_path, path_or_fileobj=local_path)
+			self._store_op_digests(local_path, op)
+			if op.upload_info.sha256.hex() == sha256:
+				self._hash_cache.mark_uploaded(local_path, self._target(repo_path))
+				return None
+			return op
+
+		if self._matches_remote(local_path, repo_path, remote):
+			return None
+		logger.debug("Hashing %s → %s", local_path, repo_path)
+		op = CommitOperationAdd(path_in_repo=repo_path, path_or_fileobj=local_path)
+		self._store_op_digests(local_path, op)
+		return op
+
+	def _store_op_digests(self, local_path: str, op):
+		"""
+		Cache the digests _matches_remote compares against, so unchanged files
+		are never re-hashed: the op's sha256, plus the git blob id for small files.
+		"""
+		try:
+			size = os.path.getsize(local_path)
+			blob_id = _git_blob_sha1(local_path, size) if size < LFS_THRESHOLD else None
+		except OSError:
+			return
+		self._hash_cache.store_digests(local_path, sha256=op.upload_info.sha256.hex(), blob_id=blob_id)
+
+	def _commit_additions(self, batch, succeeded: list, failed: list):
+		"""
+		Pre-upload the LFS blobs of a batch of (local_path, CommitOperationAdd) and commit it.
+		Appends the batch's repo paths to succeeded or failed.
+		"""
+		ops = [op for _, op in batch]
+		paths = [op.path_in_repo for op in ops]
+		logger.debug("Committing %d files", len(ops))
+		try:
+			_with_retry(self.api.preupload_lfs_files, additions=ops, **self._base_kwargs)
+			_with_retry(
+				self.api.create_commit,
+				operations=ops,
+				**self._base_kwargs,
+				commit_message=f"Upload {len(ops)} files"
+			)
+		except Exception as e:
+			logger.error("Commit of %d files failed: %s", len(ops), e)
+			failed.extend(paths)
+			return
 
+		for local_path, op in batch:
+			self._hash_cache.mark_uploaded(local_path, self._target(op.path_in_repo))
+		self._invalidate_files_cache()
+		succeeded.extend(paths)
+
+	def _remote_files_metadata(self) -> dict:
+		"""
+		Map repo path → (size, lfs sha256 or None, git blob id) for every file on the branch.
+		"""
 		try:
-			info = self.api.dataset_info(
+			info = _with_retry(
+				self.api.dataset_info,
 				repo_id=self.repo_id,
 				revision=self.branch,
-				token=self.token
+				files_metadata=True
 			)
+		except Exception as e:
+			logger.warning("Could not fetch repo metadata, uploading everything: %s", e)
+			return {}
+
+		return {
+			s.rfilename: (s.size, s.lfs.sha256 if s.lfs else None, s.blob_id)
+			for s in info.siblings
+		}
+
+	def _matches_remote(self, local_path: str, repo_path: str, remote: dict) -> bool:
+		"""
+		True if the repo already holds this exact file; records it as uploaded if so.
+		"""
+		if repo_path not in remote:
+			return False
+		size, sha256, blob_id = remote[repo_path]
+		try:
+			local_size = os.path.getsize(local_path)
+			if local_size != size:
+				return False
+			# Digests come from the cache; the file is only hashed when one is missing
+			if sha256:
+				same = self._hash_cache.sha256(local_path) == sha256
+			else:
+				same = self._hash_cache.blob_id(local_path) == blob_id
+		except OSError:
+			return False
+
+		if same:
+			self._hash_cache.mark_uploaded(local_path, self._target(repo_path))
+		return same
 
-			files = [item.rfilename for item in info.siblings]
+	# --------------------------
+	#		LIST
+	# --------------------------
+	def list_files(self, prefix: str = ""):
+		"""
+		List all files in the Hugging Face dataset repo.
+		prefix: Only return paths starting with this (e.g., "videos/")
+		"""
+		logger.info("Fetching file list...")
 
-			PrintLogger.success(f"Found {len(files)} files:")
+		files = list(self.iter_files(prefix))
 
-			return files
+		logger.info("Found %d files", len(files))
 
+		return files
+
+	def iter_files(self, prefix: str = ""):
+		"""
+		Lazily yield file paths in the repo, filtered by prefix while iterating.
+		"""
+		try:
+			files = self._fetch_files()
 		except Exception as e:
-			PrintLogger.error(f"Failed to list files: {e}")
-			return []
+			logger.error("Failed to list files: %s", e)
+			return
+
+		for name in files:
+			if not prefix or name.startswith(prefix):
+				yield name
+
+
+	def _fetch_files(self):
+		"""
+		Return the cached file list while it is fresh; once the TTL expires,
+		revalidate it with If-None-Match so an unchanged repo answers 304.
+		"""
+		now = time.monotonic()
+		if self._files_cache is not None and now - self._files_cache_ts < self._files_cache_ttl:
+			return self._files_cache
 
+		headers = build_hf_headers(token=self.token)
+		if self._files_cache is not None and self._files_etag:
+			headers["If-None-Match"] = self._files_etag
+
+		response = get_session().get(self._info_url, headers=headers)
+		if response.status_code == 304:
+			self._files_cache_ts = now
+			return self._files_cache
+		hf_raise_for_status(response)
+
+		self._files_cache = [item["rfilename"] for item in response.json().get("siblings", [])]
+		self._files_etag = response.headers.get("ETag")
+		self._files_cache_ts = now
+		return self._files_cache
+
+	def _invalidate_files_cache(self):
+		self._files_cache = None
+		self._files_etag = None
 
 	# --------------------------
 	#		DOWNLOAD
 	# --------------------------
 	def download(self, repo_path: str, local_path: str):
-		PrintLogger.info(f"Downloading {repo_path} → {local_path}")
+		ok = self._download_file(repo_path, local_path)
+		if ok:
+			logger.info("Downloaded to: %s", local_path)
+		return ok
+
+	def _download_file(self, repo_path: str, local_path: str):
+		logger.debug("Downloading %s → %s", repo_path, local_path)
 		try:
-			# Download with local_dir parameter (no cache)
-			tmp_path = hf_hub_download(
-				repo_id=self.repo_id,
+			# Download straight into the target's folder (no cache) so the
+			# final step is at most a same-filesystem rename, never a copy
+			local_dir = os.path.dirname(local_path) or "."
+			os.makedirs(local_dir, exist_ok=True)
+			tmp_path = _with_retry(
+				hf_hub_download,
 				filename=repo_path,
-				repo_type=self.repo_type,
-				revision=self.branch,
+				**self._base_kwargs,
 				token=self.token,
-				local_dir=os.path.dirname(local_path)
+				local_dir=local_dir
 			)
-			
+
 			# If filename differs, rename it
-			if tmp_path != local_path:
-				shutil.move(tmp_path, local_path)
-			
-			PrintLogger.success(f"Downloaded to: {local_path}")
+			if os.path.abspath(tmp_path) != os.path.abspath(local_path):
+				os.replace(tmp_path, local_path)
+
+			logger.debug("Downloaded to: %s", local_path)
+			return True
+		except Exception as e:
+			logger.error("Download failed: %s", e)
+		return False
+
+	def download_many(self, files):
+		"""
+		Download several files concurrently.
+		files: Iterable of (repo_path, local_path) pairs.
+		Returns (succeeded, failed) lists of repo paths.
+		"""
+		jobs = list(files)
+		with ThreadPoolExecutor(max_workers=self._download_workers) as ex:
+			results = list(ex.map(lambda job: self._download_file(*job), jobs))
+
+		succeeded = [repo_path for (repo_path, _), ok in zip(jobs, results) if ok]
+		failed = [repo_path for (repo_path, _), ok in zip(jobs, results) if not ok]
+
+		if failed:
+			logger.error("%d/%d downloads failed: %s", len(failed), len(jobs), failed)
+		else:
+			logger.info("Downloaded %d files", len(jobs))
+		return succeeded, failed
+
+	def sync_repo(self, local_dir: str, allow_patterns=None) -> bool:
+		"""
+		Download the whole repo (or the files matching allow_patterns) into local_dir.
+		allow_patterns: List of patterns to include (e.g., ["videos/*"])
+		"""
+		logger.info("Syncing %s → %s", self.repo_id, local_dir)
+		try:
+			snapshot_download(
+				**self._base_kwargs,
+				token=self.token,
+				local_dir=local_dir,
+				allow_patterns=allow_patterns,
+				max_workers=self._download_workers
+			)
+			logger.info("Synced to: %s", local_dir)
 			return True
 		except Exception as e:
-			PrintLogger.error(f"Download failed: {e}")
+			logger.error("Sync failed: %s", e)
 		return False
 
 	# --------------------------
 	#		DELETE
 	# --------------------------
 	def delete(self, repo_path: str):
-		PrintLogger.info(f"Deleting {repo_path}")
+		return self.delete_many([repo_path])
+
+	def delete_many(self, repo_paths):
+		"""
+		Delete several files from the repo in a single commit.
+		repo_paths: Iterable of paths inside the repo.
+		"""
+		repo_paths = list(repo_paths)
+		if not repo_paths:
+			return True
+
+		logger.info("Deleting %d files: %s", len(repo_paths), repo_paths)
 
 		try:
-			self.api.delete_file(
-				path_in_repo=repo_path,
-				repo_id=self.repo_id,
-				repo_type=self.repo_type,
-				revision=self.branch,
+			self.api.create_commit(
+				operations=[CommitOperationDelete(path_in_repo=p) for p in repo_paths],
+				**self._base_kwargs,
+				commit_message=f"Delete {len(repo_paths)} files"
 			)
-			PrintLogger.success(f"Deleted: {repo_path}")
+			self._hash_cache.forget(self._target(p) for p in repo_paths)
+			self._invalidate_files_cache()
+			self._hash_cache.save()
+			logger.info("Deleted: %s", repo_paths)
 			return True
 		except Exception as e:
-			PrintLogger.error(f"Delete failed: {e}")
+			logger.error("Delete failed: %s", e)
 		return False
 
 
@@ -179,10 +830,12 @@ class HFDatasetClient:
 # Example usage
 # -------------------------------------------------------
 if __name__ == "__main__":
+	logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
 	try:
 		client = HFDatasetClient()
 	except ValueError as err:
-		PrintLogger.error(err)
+		logger.error(err)
 		exit(1)
 
 	# client.upload("local.mp4", "videos/local.mp4")
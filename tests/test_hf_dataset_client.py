@@ -0,0 +1,457 @@
+import os
+import sys
+import json
+import types
+import hashlib
+import inspect
+import logging
+import tempfile
+import threading
+import unittest
+import importlib.util
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# --------------------------
+#	   HUB STUBS
+# --------------------------
+# huggingface_hub is always stubbed so the tests never touch the network;
+# requests / urllib3 are only stubbed when they are not installed.
+def _module(name, **attrs):
+	module = types.ModuleType(name)
+	module.__dict__.update(attrs)
+	sys.modules[name] = module
+	return module
+
+
+class HfHubHTTPError(Exception):
+	def __init__(self, message="", response=None):
+		super().__init__(message)
+		self.response = response
+
+
+class LocalEntryNotFoundError(HfHubHTTPError):
+	pass
+
+
+class CommitOperationAdd:
+	def __init__(self, path_in_repo, path_or_fileobj):
+		self.path_in_repo = path_in_repo
+		self.path_or_fileobj = path_or_fileobj
+		with open(path_or_fileobj, "rb") as f:
+			digest = hashlib.sha256(f.read()).digest()
+		self.upload_info = types.SimpleNamespace(sha256=digest)
+
+
+class CommitOperationDelete:
+	def __init__(self, path_in_repo):
+		self.path_in_repo = path_in_repo
+
+
+class FakeHfApi:
+	endpoint = "https://huggingface.co"
+
+	def __init__(self, token=None):
+		self.commits = []
+		self.siblings = []
+
+	def dataset_info(self, repo_id, revision=None, files_metadata=False):
+		return types.SimpleNamespace(siblings=self.siblings)
+
+	def preupload_lfs_files(self, repo_id, additions, **kwargs):
+		pass
+
+	def create_commit(self, repo_id, operations, commit_message, **kwargs):
+		self.commits.append([op.path_in_repo for op in operations])
+
+
+if importlib.util.find_spec("requests") is None:
+	class _Session:
+		def mount(self, prefix, adapter):
+			pass
+
+	_requests = _module("requests", Session=_Session, ConnectionError=type("ConnectionError", (OSError,), {}), Timeout=type("Timeout", (OSError,), {}))
+	_requests.adapters = _module("requests.adapters", HTTPAdapter=object)
+
+if importlib.util.find_spec("urllib3") is None:
+	_module("urllib3")
+	_module("urllib3.util")
+	_module("urllib3.util.retry", Retry=lambda **kwargs: kwargs)
+
+_hub = _module(
+	"huggingface_hub",
+	HfApi=FakeHfApi,
+	CommitOperationAdd=CommitOperationAdd,
+	CommitOperationDelete=CommitOperationDelete,
+	hf_hub_download=mock.Mock(),
+	snapshot_download=mock.Mock(),
+	get_session=mock.Mock(),
+	configure_http_backend=mock.Mock(),
+	constants=types.SimpleNamespace(HF_HUB_OFFLINE=False),
+)
+_hub.utils = _module(
+	"huggingface_hub.utils",
+	HfHubHTTPError=HfHubHTTPError,
+	LocalEntryNotFoundError=LocalEntryNotFoundError,
+	build_hf_headers=lambda token=None: {},
+	hf_raise_for_status=lambda response: None,
+)
+_hub.utils._http = _module("huggingface_hub.utils._http", UniqueRequestIdAdapter=lambda **kwargs: object())
+
+import requests  # noqa: E402
+import hf_dataset_client  # noqa: E402
+from hf_dataset_client import HFDatasetClient, _HashCache, _compile_ignore, _scan_files, _git_blob_sha1, _with_retry  # noqa: E402
+
+# Keep expected warnings/errors out of the test output
+hf_dataset_client.logger.addHandler(logging.NullHandler())
+
+
+def _write(root, rel_path, content="x"):
+	path = os.path.join(root, rel_path)
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, "w") as f:
+		f.write(content)
+	return path
+
+
+# --------------------------
+#	   API SURFACE
+# --------------------------
+class TestApiSurface(unittest.TestCase):
+	def test_exports(self):
+		self.assertEqual(sorted(hf_dataset_client.__all__), ["DEFAULT_IGNORE_PATTERNS", "HFDatasetClient", "set_log_level"])
+
+	def test_public_methods(self):
+		public = {
+			name: str(inspect.signature(member))
+			for name, member in inspect.getmembers(HFDatasetClient, inspect.isfunction)
+			if not name.startswith("_")
+		}
+		self.assertEqual(public, {
+			"upload": "(self, local_path: str, repo_path: str)",
+			"upload_folder": "(self, local_folder: str, repo_base_path: str = '', ignore_patterns=None) -> bool",
+			"upload_many": "(self, files)",
+			"upload_folder_files": "(self, local_folder: str, repo_base_path: str = '', ignore_patterns=None, skip_unchanged: bool = True)",
+			"list_files": "(self, prefix: str = '')",
+			"iter_files": "(self, prefix: str = '')",
+			"download": "(self, repo_path: str, local_path: str)",
+			"download_many": "(self, files)",
+			"sync_repo": "(self, local_dir: str, allow_patterns=None) -> bool",
+			"delete": "(self, repo_path: str)",
+			"delete_many": "(self, repo_paths)",
+		})
+
+	def test_requires_env(self):
+		with mock.patch.dict(os.environ, {"HF_TOKEN": "", "HF_REPO_ID": "user/repo"}):
+			with self.assertRaises(ValueError):
+				HFDatasetClient()
+
+	def test_requires_positive_workers(self):
+		with mock.patch.dict(os.environ, {"HF_TOKEN": "token", "HF_REPO_ID": "user/repo", "HF_UPLOAD_WORKERS": "0"}):
+			with self.assertRaises(ValueError):
+				HFDatasetClient()
+
+
+# --------------------------
+#	   FOLDER SCAN
+# --------------------------
+class TestScanFiles(unittest.TestCase):
+	def setUp(self):
+		tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(tmp.cleanup)
+		self.root = tmp.name
+		for rel_path in ["a.txt", ".env", ".git/HEAD", "sub/b.bin", "sub/.hidden", "a/.git/x", "a/.DS_Store", "temp/t.txt"]:
+			_write(self.root, rel_path)
+
+	def scan(self, extra=()):
+		patterns = hf_dataset_client.DEFAULT_IGNORE_PATTERNS + hf_dataset_client.NESTED_IGNORE_PATTERNS + list(extra)
+		ignore_re = _compile_ignore(tuple(patterns))
+		return sorted(rel_path for _, rel_path in _scan_files(self.root, ignore_re))
+
+	def test_default_ignores_apply_at_every_depth(self):
+		self.assertEqual(self.scan(), ["a.txt", "sub/b.bin", "temp/t.txt"])
+
+	def test_upload_folder_defaults_are_root_only(self):
+		self.assertEqual(hf_dataset_client.DEFAULT_IGNORE_PATTERNS, [".git/*", ".DS_Store", ".*"])
+
+	def test_user_patterns_prune_directories(self):
+		self.assertEqual(self.scan(["temp/*"]), ["a.txt", "sub/b.bin"])
+
+	def test_unreadable_folder_is_skipped(self):
+		real_scandir = os.scandir
+
+		def scandir(path):
+			if path.endswith("sub"):
+				raise PermissionError(13, "Permission denied", path)
+			return real_scandir(path)
+
+		with mock.patch("os.scandir", scandir):
+			self.assertEqual(self.scan(), ["a.txt", "temp/t.txt"])
+
+
+# --------------------------
+#	   HASHING / CACHE
+# --------------------------
+class TestHashing(unittest.TestCase):
+	def test_git_blob_sha1_matches_git(self):
+		with tempfile.TemporaryDirectory() as root:
+			path = _write(root, "f", "hello\n")
+			self.assertEqual(_git_blob_sha1(path, 6), "ce013625030ba8dba906f756967f9e9ca394464a")
+
+
+class TestHashCache(unittest.TestCase):
+	def setUp(self):
+		tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(tmp.cleanup)
+		self.root = tmp.name
+		self.cache_path = os.path.join(self.root, "cache", "hashes.json")
+		self.file = _write(self.root, "a.txt", "one")
+
+	def test_roundtrip_and_invalidation(self):
+		cache = _HashCache(self.cache_path)
+		cache.mark_uploaded(self.file, "repo@main:a.txt")
+		cache.save()
+
+		reloaded = _HashCache(self.cache_path)
+		self.assertTrue(reloaded.is_uploaded(self.file, "repo@main:a.txt"))
+
+		_write(self.root, "a.txt", "changed")
+		self.assertFalse(reloaded.is_uploaded(self.file, "repo@main:a.txt"))
+
+	def test_instances_merge_on_save(self):
+		other = _write(self.root, "b.txt", "two")
+		first, second = _HashCache(self.cache_path), _HashCache(self.cache_path)
+		first.mark_uploaded(self.file, "t1")
+		second.mark_uploaded(other, "t2")
+		first.save()
+		second.save()
+
+		with open(self.cache_path) as f:
+			self.assertEqual(set(json.load(f)), {os.path.abspath(self.file), os.path.abspath(other)})
+
+	def test_forget_prunes_entry(self):
+		cache = _HashCache(self.cache_path)
+		cache.mark_uploaded(self.file, "t1")
+		cache.forget(["t1"])
+		cache.save()
+
+		with open(self.cache_path) as f:
+			self.assertEqual(json.load(f), {})
+
+	def test_save_is_best_effort(self):
+		cache = _HashCache(os.path.join(self.file, "not-a-dir", "hashes.json"))
+		cache.mark_uploaded(self.file, "t1")
+		cache.save()
+
+	def test_mark_uploaded_missing_file(self):
+		cache = _HashCache(self.cache_path)
+		cache.mark_uploaded(os.path.join(self.root, "gone.txt"), "t1")
+
+
+# --------------------------
+#	   RETRY
+# --------------------------
+@mock.patch("hf_dataset_client.time.sleep")
+class TestWithRetry(unittest.TestCase):
+	def test_retries_transient_status(self, sleep):
+		fn = mock.Mock(side_effect=[HfHubHTTPError("busy", types.SimpleNamespace(status_code=503)), "ok"])
+		self.assertEqual(_with_retry(fn), "ok")
+		self.assertEqual(fn.call_count, 2)
+
+	def test_raises_permanent_error(self, sleep):
+		fn = mock.Mock(side_effect=HfHubHTTPError("missing", types.SimpleNamespace(status_code=404)))
+		with self.assertRaises(HfHubHTTPError):
+			_with_retry(fn)
+		self.assertEqual(fn.call_count, 1)
+
+	def test_retries_wrapped_connection_error(self, sleep):
+		error = LocalEntryNotFoundError("offline")
+		error.__cause__ = requests.ConnectionError("reset")
+		fn = mock.Mock(side_effect=[error, "ok"])
+		self.assertEqual(_with_retry(fn), "ok")
+
+	def test_gives_up_after_max_attempts(self, sleep):
+		fn = mock.Mock(side_effect=requests.Timeout("slow"))
+		with self.assertRaises(requests.Timeout):
+			_with_retry(fn)
+		self.assertEqual(fn.call_count, hf_dataset_client.MAX_ATTEMPTS)
+
+
+class _ClientTestCase(unittest.TestCase):
+	def setUp(self):
+		tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(tmp.cleanup)
+		self.root = tmp.name
+		with mock.patch.dict(os.environ, {"HF_TOKEN": "token", "HF_REPO_ID": "user/repo"}):
+			self.client = HFDatasetClient()
+		self.client._hash_cache = _HashCache(os.path.join(self.root, "cache", "hashes.json"))
+		self.folder = os.path.join(self.root, "data")
+
+	def sibling(self, rel_path, lfs=False):
+		path = os.path.join(self.folder, rel_path)
+		size = os.path.getsize(path)
+		if lfs:
+			with open(path, "rb") as f:
+				return types.SimpleNamespace(rfilename=rel_path, size=size, lfs=types.SimpleNamespace(sha256=hashlib.sha256(f.read()).hexdigest()), blob_id=None)
+		return types.SimpleNamespace(rfilename=rel_path, size=size, lfs=None, blob_id=_git_blob_sha1(path, size))
+
+
+# --------------------------
+#	   UPLOAD MANY
+# --------------------------
+class TestUploadMany(_ClientTestCase):
+	def test_repeat_runs_do_not_rehash(self):
+		jobs = [(_write(self.folder, "small.txt", "abc"), "small.txt"), (_write(self.folder, "big.bin", "lfs"), "big.bin")]
+		self.assertEqual(self.client.upload_many(jobs), (["small.txt", "big.bin"], []))
+		self.client.api.siblings = [self.sibling("small.txt"), self.sibling("big.bin", lfs=True)]
+
+		with mock.patch("hf_dataset_client._file_digest", wraps=hf_dataset_client._file_digest) as digest:
+			succeeded, failed = self.client.upload_many(jobs)
+
+		self.assertEqual(digest.call_count, 0)
+		self.assertEqual(sorted(succeeded), ["big.bin", "small.txt"])
+		self.assertEqual(len(self.client.api.commits), 2)
+
+	def test_reuploads_when_repo_copy_is_gone(self):
+		jobs = [(_write(self.folder, "a.txt", "abc"), "a.txt")]
+		self.client.upload_many(jobs)
+		self.client.upload_many(jobs)
+		self.assertEqual(self.client.api.commits, [["a.txt"], ["a.txt"]])
+
+
+# --------------------------
+#	 UPLOAD FOLDER FILES
+# --------------------------
+class TestUploadFolderFiles(_ClientTestCase):
+	def test_commits_in_batches(self):
+		for i in range(5):
+			_write(self.folder, f"f{i}.txt", str(i))
+
+		with mock.patch("hf_dataset_client.COMMIT_BATCH_SIZE", 2):
+			succeeded, failed = self.client.upload_folder_files(self.folder, "base")
+
+		self.assertEqual(failed, [])
+		self.assertEqual(sorted(succeeded), [f"base/f{i}.txt" for i in range(5)])
+		self.assertEqual(sorted(len(commit) for commit in self.client.api.commits), [1, 2, 2])
+
+	def test_skips_files_matching_the_repo(self):
+		same = _write(self.folder, "same.bin", "lfs")
+		_write(self.folder, "changed.txt", "new")
+		with open(same, "rb") as f:
+			sha256 = hashlib.sha256(f.read()).hexdigest()
+		self.client.api.siblings = [
+			types.SimpleNamespace(rfilename="same.bin", size=3, lfs=types.SimpleNamespace(sha256=sha256), blob_id=None),
+			types.SimpleNamespace(rfilename="changed.txt", size=3, lfs=None, blob_id="0" * 40),
+		]
+
+		succeeded, failed = self.client.upload_folder_files(self.folder)
+
+		self.assertEqual(sorted(succeeded), ["changed.txt", "same.bin"])
+		self.assertEqual(self.client.api.commits, [["changed.txt"]])
+
+	def test_walk_error_is_raised_after_commit(self):
+		entry = types.SimpleNamespace(path=_write(self.folder, "a.txt"))
+
+		def scan(folder, ignore_re):
+			yield entry, "a.txt"
+			raise PermissionError("denied")
+
+		with mock.patch("hf_dataset_client._scan_files", scan):
+			with self.assertRaises(PermissionError):
+				self.client.upload_folder_files(self.folder)
+
+		self.assertEqual(self.client.api.commits, [["a.txt"]])
+
+	def test_threads_stop_when_commit_fails(self):
+		for i in range(20):
+			_write(self.folder, f"f{i}.txt", str(i))
+		before = threading.active_count()
+
+		with mock.patch("hf_dataset_client.COMMIT_BATCH_SIZE", 1), \
+				mock.patch.object(self.client, "_commit_additions", side_effect=RuntimeError("boom")):
+			with self.assertRaises(RuntimeError):
+				self.client.upload_folder_files(self.folder)
+
+		self.assertEqual(threading.active_count(), before)
+
+
+# --------------------------
+#	   LIST FILES
+# --------------------------
+def _info_response(status_code, names=(), etag=None):
+	return mock.Mock(
+		status_code=status_code,
+		headers={"ETag": etag} if etag else {},
+		json=lambda: {"siblings": [{"rfilename": name} for name in names]},
+	)
+
+
+class TestListFiles(_ClientTestCase):
+	def setUp(self):
+		super().setUp()
+		patcher = mock.patch("hf_dataset_client.get_session")
+		self.session = patcher.start().return_value
+		self.addCleanup(patcher.stop)
+
+	def test_fresh_cache_skips_request(self):
+		self.session.get.return_value = _info_response(200, ["a.txt"])
+		self.assertEqual(self.client.list_files(), ["a.txt"])
+		self.assertEqual(self.client.list_files(), ["a.txt"])
+		self.assertEqual(self.session.get.call_count, 1)
+
+	def test_revalidates_with_etag(self):
+		self.client._files_cache_ttl = 0
+		self.session.get.side_effect = [_info_response(200, ["a.txt", "b/c.txt"], etag='"v1"'), _info_response(304)]
+
+		self.assertEqual(self.client.list_files(), ["a.txt", "b/c.txt"])
+		self.assertEqual(self.client.list_files("b/"), ["b/c.txt"])
+
+		first, second = self.session.get.call_args_list
+		self.assertNotIn("If-None-Match", first.kwargs["headers"])
+		self.assertEqual(second.kwargs["headers"]["If-None-Match"], '"v1"')
+
+	def test_upload_and_delete_invalidate_cache(self):
+		self.session.get.return_value = _info_response(200, ["a.txt"], etag='"v1"')
+		self.client.list_files()
+		self.assertTrue(self.client.upload(_write(self.folder, "a.txt"), "a.txt"))
+		self.assertIsNone(self.client._files_cache)
+
+		self.client.list_files()
+		self.assertTrue(self.client.delete("a.txt"))
+		self.assertIsNone(self.client._files_cache)
+		self.assertIsNone(self.client._files_etag)
+
+
+# --------------------------
+#	   DOWNLOAD / DELETE
+# --------------------------
+class TestDownload(_ClientTestCase):
+	def download(self, local_path):
+		fetched = os.path.join(self.folder, "a.txt")
+		with mock.patch("hf_dataset_client.hf_hub_download", return_value=fetched), \
+				mock.patch("hf_dataset_client.os.replace") as replace:
+			self.assertTrue(self.client.download("a.txt", local_path))
+		return replace
+
+	def test_no_rename_when_paths_match(self):
+		self.download(os.path.join(self.folder, "a.txt")).assert_not_called()
+
+	def test_renames_to_requested_name(self):
+		target = os.path.join(self.folder, "b.txt")
+		self.download(target).assert_called_once_with(os.path.join(self.folder, "a.txt"), target)
+
+
+class TestDeleteMany(_ClientTestCase):
+	def test_single_commit(self):
+		self.assertTrue(self.client.delete_many(["a.txt", "b/c.txt"]))
+		self.assertEqual(self.client.api.commits, [["a.txt", "b/c.txt"]])
+
+	def test_empty_is_noop(self):
+		self.assertTrue(self.client.delete_many([]))
+		self.assertEqual(self.client.api.commits, [])
+
+
+if __name__ == "__main__":
+	unittest.main()